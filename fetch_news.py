@@ -1,67 +1,92 @@
 import feedparser
+from lxml import etree
+from collections import namedtuple
+import asyncio
+import atexit
+import aiohttp
+import ahocorasick
 import re
-import requests
+import html
+import urllib.parse
 from bs4 import BeautifulSoup
 from googletrans import Translator
-import json
+import orjson
 import time
+from concurrent.futures import ThreadPoolExecutor
 import schedule
 from datetime import datetime, timedelta
 import os
+import shelve
+import hashlib
 import dateutil.parser
+from email.utils import parsedate_to_datetime
+
+# lxml is already required for RSS parsing, so BeautifulSoup uses its C parser too
+HTML_PARSER = "lxml"
 
 # Configuration
 # Google News RSS allows searching. We will use multiple specific queries.
 BASE_RSS_URL = "https://news.google.com/rss/search?q={query}&hl=mr-IN&gl=IN&ceid=IN:mr"
 
+# Tehsil specific - adding 'Latur' to ensure district relevance
+TEHSILS = [
+    "Udgir", "Ausa", "Nilanga", "Ahmedpur", "Chakur", "Renapur", "Jalkot",
+    '"Shirur Anantpal"', "Deoni"
+]
+
+# Specific Portals
+PORTAL_SITES = [
+    "lokmat.com", "esakal.com", "pudhari.news", "saamana.com", "tv9marathi.com",
+    "abpmajha.abplive.in", "news18.com", "zeenews.india.com", "maharashtratimes.com",
+    "loksatta.com", "divyamarathi.bhaskar.com", "ekmat.com", "public.app"
+]
+
+# New Portals
+NEW_PORTAL_SITES = [
+    "ndtv.com", "saamtv.esakal.com", "agrowon.esakal.com", "sarkarnama.esakal.com",
+    "tarunbharat.com", "deshonnati.com", "jaimaharashtranews.com", "maxmaharashtra.com",
+    "punyanagari.com", "timesofindia.indiatimes.com", "hindustantimes.com", "aajlatur.com"
+]
+
+# Google News search supports OR, so tehsils and portals are grouped into a few
+# combined queries instead of one request each. Every query returns at most ~100
+# items, so groups are kept small to limit how much a busy day can crowd out.
+TEHSILS_PER_QUERY = 3
+SITES_PER_QUERY = 7
+
+def chunk_evenly(items, max_size):
+    """Split items into the fewest groups of at most max_size, with sizes as equal as possible."""
+    count = -(-len(items) // max_size)
+    size = -(-len(items) // count)
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+def or_query(terms, suffix):
+    """Build a Google News query matching any of terms, followed by suffix."""
+    return "(" + " OR ".join(terms) + ") " + suffix
+
 QUERIES = [
     "Latur District News when:1d",
     "Latur City News when:1d",
-    # Tehsil specific - adding 'Latur' to ensure district relevance
-    "Udgir Latur News when:1d",
-    "Ausa Latur News when:1d",
-    "Nilanga Latur News when:1d",
-    "Ahmedpur Latur News when:1d",
-    "Chakur Latur News when:1d",
-    "Renapur Latur News when:1d",
-    "Jalkot Latur News when:1d", 
-    "Shirur Anantpal Latur News when:1d",
-    "Deoni Latur News when:1d",
-    # Specific Portals
-    "site:lokmat.com Latur when:1d",
-    "site:esakal.com Latur when:1d",
-    "site:pudhari.news Latur when:1d",
-    "site:saamana.com Latur when:1d",
-    "site:tv9marathi.com Latur when:1d",
-    "site:abpmajha.abplive.in Latur when:1d",
-    "site:news18.com Latur when:1d",
-    "site:zeenews.india.com Latur when:1d",
-    "site:maharashtratimes.com Latur when:1d",
-    "site:loksatta.com Latur when:1d",
-    "site:divyamarathi.bhaskar.com Latur when:1d",
-    "site:ekmat.com Latur when:1d",
-    "site:public.app Latur when:1d",
+] + [
+    or_query(group, "Latur News when:1d") for group in chunk_evenly(TEHSILS, TEHSILS_PER_QUERY)
+] + [
+    or_query(["site:" + site for site in group], "Latur when:1d")
+    for group in chunk_evenly(PORTAL_SITES, SITES_PER_QUERY)
+] + [
     "Latur Samachar when:1d",
     # ePaper Queries
     "Lokmat ePaper Latur when:1d",
     "Esakal ePaper Latur when:1d",
     "Ekmat ePaper Latur when:1d",
     "Pudhari ePaper Latur when:1d",
-    # New Portals
-    "site:ndtv.com Latur when:1d",
-    "site:saamtv.esakal.com Latur when:1d",
-    "site:agrowon.esakal.com Latur when:1d",
-    "site:sarkarnama.esakal.com Latur when:1d",
-    "site:tarunbharat.com Latur when:1d",
-    "site:deshonnati.com Latur when:1d",
-    "site:jaimaharashtranews.com Latur when:1d",
-    "site:maxmaharashtra.com Latur when:1d",
-    "site:punyanagari.com Latur when:1d",
-    "site:timesofindia.indiatimes.com Latur when:1d",
-    "site:hindustantimes.com Latur when:1d",
-    "site:aajlatur.com Latur when:1d"
+] + [
+    or_query(["site:" + site for site in group], "Latur when:1d")
+    for group in chunk_evenly(NEW_PORTAL_SITES, SITES_PER_QUERY)
 ]
 
+# Query URLs never change, so encode them once at import
+FEED_URLS = [BASE_RSS_URL.format(query=urllib.parse.quote(query)) for query in QUERIES]
+
 # Strict Filter Keywords (Latur District Locations)
 DISTRICT_KEYWORDS = [
     # English
@@ -118,183 +143,405 @@ SOURCE_DOMAINS = {
     "Public.app": "public.app"
 }
 
+# Automaton over lowercased source names for the partial-match logo fallback.
+# Each hit carries the name's position in SOURCE_DOMAINS so the earliest listed
+# name still wins, as with a scan of the dict in order.
+SOURCE_AUTOMATON = ahocorasick.Automaton()
+for index, (name, dom) in enumerate(SOURCE_DOMAINS.items()):
+    SOURCE_AUTOMATON.add_word(name.lower(), (index, dom))
+SOURCE_AUTOMATON.make_automaton()
+
+def find_source_domain(source_name):
+    """Return the logo domain for a source name, by exact or partial match."""
+    domain = SOURCE_DOMAINS.get(source_name)
+    if domain:
+        return domain
+    # Try to find a partial match in one pass over the name
+    matches = [hit for _, hit in SOURCE_AUTOMATON.iter(source_name.lower())]
+    if matches:
+        return min(matches)[1]
+    return None
+
 JSON_FILE = "news_data.json"
 TRANSLATOR = Translator(timeout=10)
+# On-disk cache of source text -> Marathi translation, kept across ticks and restarts.
+# Only last-24-hour news is published, so translations unused for two days are pruned.
+TRANSLATION_CACHE_FILE = ".trans_cache"
+TRANSLATION_CACHE_MAX_AGE = 2 * 24 * 3600
+
+# Concurrent fetching: at most this many feed requests are in flight at once
+MAX_CONCURRENT_FETCHES = 10
+FETCH_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+# One event loop and HTTP session for the life of the process, so the
+# scheduler's 30-minute ticks reuse pooled keep-alive connections.
+# Both are created on first fetch and closed when the process exits.
+EVENT_LOOP = None
+HTTP_SESSION = None
+
+def get_event_loop():
+    """Return the shared event loop, creating it on first use."""
+    global EVENT_LOOP
+    if EVENT_LOOP is None or EVENT_LOOP.is_closed():
+        EVENT_LOOP = asyncio.new_event_loop()
+    return EVENT_LOOP
+
+def get_http_session():
+    """Return the shared aiohttp session, creating it on first use."""
+    global HTTP_SESSION
+    if HTTP_SESSION is None or HTTP_SESSION.closed:
+        HTTP_SESSION = aiohttp.ClientSession(timeout=FETCH_TIMEOUT)
+    return HTTP_SESSION
+
+def close_http_session():
+    """Close the shared session and event loop, if they were ever created."""
+    global EVENT_LOOP, HTTP_SESSION
+    if EVENT_LOOP is None or EVENT_LOOP.is_closed():
+        return
+    if HTTP_SESSION is not None and not HTTP_SESSION.closed:
+        EVENT_LOOP.run_until_complete(HTTP_SESSION.close())
+    EVENT_LOOP.close()
+    EVENT_LOOP = None
+    HTTP_SESSION = None
+
+atexit.register(close_http_session)
+
+# Lightweight feed entry; only the fields the pipeline reads from Google News RSS
+Entry = namedtuple("Entry", ["title", "link", "published", "summary", "source_title"])
+
+# Never resolve external entities or touch the network while parsing remote feeds
+RSS_PARSER = etree.XMLParser(resolve_entities=False, no_network=True)
+
+def parse_feed(data):
+    """Parse Google News RSS bytes into Entry tuples, falling back to feedparser."""
+    try:
+        root = etree.fromstring(data, RSS_PARSER)
+    except etree.XMLSyntaxError:
+        # Malformed XML: let feedparser's lenient parser recover what it can
+        feed = feedparser.parse(data)
+        return [
+            Entry(
+                title=e.get('title', ''),
+                link=e.get('link', ''),
+                published=e.get('published', ''),
+                summary=e.get('summary', ''),
+                source_title=e.source.get('title', '') if 'source' in e else "",
+            )
+            for e in feed.entries
+        ]
+
+    entries = []
+    for item in root.iterfind('channel/item'):
+        source = item.find('source')
+        entries.append(Entry(
+            title=item.findtext('title', ''),
+            link=item.findtext('link', ''),
+            published=item.findtext('pubDate', ''),
+            summary=item.findtext('description', ''),
+            source_title=(source.text or "") if source is not None else "",
+        ))
+    return entries
+
+# Conditional GET state kept across scheduler ticks: URL -> (etag, last_modified)
+# and URL -> entries from the last full response, reused when the feed answers 304
+FEED_STATE = {}
+FEED_ENTRIES = {}
+
+async def fetch_feed(session, semaphore, query, formatted_url):
+    """Download one RSS query and parse it off the event loop."""
+    headers = {}
+    prev_etag, prev_modified = FEED_STATE.get(formatted_url, (None, None))
+    if prev_etag:
+        headers["If-None-Match"] = prev_etag
+    if prev_modified:
+        headers["If-Modified-Since"] = prev_modified
+
+    async with semaphore:
+        print(f"Fetching: {query}")
+        async with session.get(formatted_url, headers=headers) as resp:
+            if resp.status == 304 and formatted_url in FEED_ENTRIES:
+                return FEED_ENTRIES[formatted_url]
+            resp.raise_for_status()
+            data = await resp.read()
+            etag = resp.headers.get("ETag")
+            modified = resp.headers.get("Last-Modified")
+    # Parsing is CPU-bound; run it in the default executor so other downloads keep flowing
+    loop = asyncio.get_running_loop()
+    entries = await loop.run_in_executor(None, parse_feed, data)
+
+    if etag or modified:
+        FEED_STATE[formatted_url] = (etag, modified)
+        FEED_ENTRIES[formatted_url] = entries
+    return entries
+
+async def fetch_all():
+    """Fetch every query concurrently and return the combined entries in query order."""
+    session = get_http_session()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+    results = await asyncio.gather(
+        *[fetch_feed(session, semaphore, query, url) for query, url in zip(QUERIES, FEED_URLS)],
+        return_exceptions=True
+    )
+
+    all_entries = []
+    for query, result in zip(QUERIES, results):
+        if isinstance(result, Exception):
+            print(f"Error fetching {query}: {result}")
+            continue
+        all_entries.extend(result)
+    return all_entries
+
+# Aho-Corasick automaton over all district keywords, built once at import so each
+# check is a single linear pass over the text regardless of how many keywords there are.
+# English names must sit on word boundaries to avoid false positives (e.g. "Legislature").
+# Marathi names are matched as plain substrings to catch inflections (e.g. "लातूरमध्ये", "लातूरचा").
+KEYWORD_AUTOMATON = ahocorasick.Automaton()
+for keyword in DISTRICT_KEYWORDS:
+    KEYWORD_AUTOMATON.add_word(keyword.lower(), (len(keyword), keyword.isascii()))
+KEYWORD_AUTOMATON.make_automaton()
+
+def _is_word_char(c):
+    return c.isalnum() or c == '_'
 
 def is_relevant(text):
     """Check if text contains any district keyword using strict word boundaries."""
     if not text:
         return False
-    text_lower = text.lower()
-    
-    for keyword in DISTRICT_KEYWORDS:
-        # Check if keyword is ASCII (English) or Unicode (likely Marathi)
-        if keyword.isascii():
-            # For English, stick to strict word boundaries to avoid false positives (e.g. "Legislature")
-            pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-            if re.search(pattern, text_lower):
-                return True
-        else:
-            # For Marathi, relax strict boundaries to catch inflections (e.g. "लातूरमध्ये", "लातूरचा")
-            # Simple substring check is usually safe for these distinct place names
-            if keyword.lower() in text_lower:
-                return True
-            
+    return is_relevant_lower(text.lower())
+
+def is_relevant_lower(t):
+    """Same as is_relevant, for text the caller has already lowercased."""
+    for end, (length, is_ascii) in KEYWORD_AUTOMATON.iter(t):
+        if not is_ascii:
+            return True
+        start = end - length + 1
+        if (start == 0 or not _is_word_char(t[start - 1])) and \
+           (end + 1 == len(t) or not _is_word_char(t[end + 1])):
+            return True
     return False
 
 TRUSTED_SOURCES = [
     "Latur Samachar", "Aaj Latur", "Ekmat", "dainikekmat.com", "Public App", "Public.app", "Punyanagari", "punyanagari.com"
 ]
 
-def fetch_and_process_news():
-    print(f"[{datetime.now()}] Checking for news from multiple sources...")
-    
-    # Clear existing data to ensure no stale/unfiltered items remain if fetch fails
-    if os.path.exists(JSON_FILE):
-        try:
-            os.remove(JSON_FILE)
-            print("Cleared old news data.")
-        except Exception as e:
-            print(f"Warning: Could not clear old data: {e}")
+# Single precompiled pattern so the trusted check is one scan of the source name
+TRUSTED_RE = re.compile('|'.join(re.escape(name) for name in TRUSTED_SOURCES))
 
-    all_entries = []
-    
-    # Fetch from all queries
-    for query in QUERIES:
-        try:
-            formatted_url = BASE_RSS_URL.format(query=requests.utils.quote(query))
-            print(f"Fetching: {query}")
-            feed = feedparser.parse(formatted_url)
-            all_entries.extend(feed.entries)
-        except Exception as e:
-            print(f"Error fetching {query}: {e}")
+# Summaries are short RSS snippets, so flattening them to text only needs a tag strip
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
 
-    news_items = []
-    seen_titles = set()
+def html_to_text(summary_html):
+    """Flatten an HTML snippet to plain text without building a parse tree."""
+    return _WS_RE.sub(' ', html.unescape(_TAG_RE.sub('', summary_html))).strip()
 
-    # Sort entries by published date (newest first)
-    # Default sorting might be mixed, so let's try to sort if parsed_published exists
-    # If not, we rely on feed order (usually relevant)
-    
-    for entry in all_entries:
-        # Basic info
-        title = entry.title
-        link = entry.link
+_DEVA_RE = re.compile(r'[\u0900-\u097f]')
+
+def is_marathi(text):
+    """Treat text containing any Devanagari character as already Marathi."""
+    # Pure-ASCII text (most English headlines) cannot contain Devanagari
+    if text.isascii():
+        return False
+    return _DEVA_RE.search(text) is not None
 
+def translate_items(news_items):
+    """Translate non-Marathi titles and descriptions in place, one item at a time."""
+    # Marathi text is written in Devanagari, so a codepoint check stands in for
+    # an API language-detection round-trip. Only titles without it are translated.
+    pending = [item for item in news_items if not is_marathi(item["title"])]
 
-        if title in seen_titles:
-            continue
-            
-        # Check source for trusted bypass
-        source_title = entry.source.title if 'source' in entry else ""
-        is_trusted = any(trusted in source_title for trusted in TRUSTED_SOURCES)
-
-        # Strict Filtering: Check if title or link implies relevance
-        # We can't check description effectively yet as it might need fetching/translating,
-        # but let's check what we have (title).
-        # We will also check description AFTER extraction/translation if needed, 
-        # but filtering early saves processing.
-        if not is_trusted and not is_relevant(title):
-            # If title doesn't match, check description/summary
-            # We extract description text early for checking
-            temp_desc = BeautifulSoup(entry.summary, "html.parser").get_text() if 'summary' in entry else ""
-            if not is_relevant(temp_desc):
-                 # print(f"Skipping unrelated (Title & Desc mismatch): {title}")
-                 continue
-
-        seen_titles.add(title)
-
-        # Parse date to ensure it's today's news
-        pub_date_str = entry.published
-        is_today = False
+    with shelve.open(TRANSLATION_CACHE_FILE) as cache:
+        for item in pending:
+            try:
+                # Translate Title
+                item["title"] = translate_text(cache, item["title"])
+                # Translate Description (truncate if too long to save API/time)
+                item["description"] = translate_text(cache, item["description"][:500])
+            except Exception as e:
+                # Fallback: keep original text if translation fails
+                print(f"Translation warning for '{item['title'][:20]}...': {e}")
+
+        prune_translation_cache(cache)
+
+def translation_key(text):
+    """Compact cache key for a Marathi translation of text."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+def translate_text(cache, text):
+    """Translate text to Marathi, answering repeats from the on-disk cache."""
+    key = translation_key(text)
+    now = time.time()
+    cached = cache.get(key)
+    if cached is not None:
+        # Refresh the timestamp so translations still in use are never pruned
+        cache[key] = (now, cached[1])
+        return cached[1]
+    translated = TRANSLATOR.translate(text, dest='mr').text
+    # Store right away so a later failure in the same run doesn't lose this result
+    cache[key] = (now, translated)
+    return translated
+
+def prune_translation_cache(cache):
+    """Drop cached translations that have not been used within the max age."""
+    cutoff = time.time() - TRANSLATION_CACHE_MAX_AGE
+    stale = [key for key in cache.keys() if cache[key][0] < cutoff]
+    for key in stale:
+        del cache[key]
+
+# Google News appends the publisher to each title (e.g. "... - Lokmat"), so the same
+# story fetched by several queries can differ only in that suffix
+_SOURCE_SUFFIX_RE = re.compile(r'\s+-\s+[^-]+$')
+
+def title_key(title_l):
+    """Normalized key, from a lowercased title, used to spot the same story across queries."""
+    return _SOURCE_SUFFIX_RE.sub('', title_l).strip()
+
+def process_entry(entry, title_l, now):
+    """Filter one feed entry and build its news item, or return None if it is dropped."""
+    # Basic info; title_l is the title lowercased once by the caller
+    title = entry.title
+    link = entry.link
+    source_title = entry.source_title
+
+    # Flatten the summary once and reuse it for relevance and description
+    summary_html = entry.summary
+    temp_desc = html_to_text(summary_html)
+        
+    # Check source for trusted bypass
+    is_trusted = TRUSTED_RE.search(source_title) is not None
+
+    # Strict Filtering: Check if title or link implies relevance
+    # We can't check description effectively yet as it might need fetching/translating,
+    # but let's check what we have (title).
+    # We will also check description AFTER extraction/translation if needed, 
+    # but filtering early saves processing.
+    if not is_trusted and not is_relevant_lower(title_l):
+        # If title doesn't match, check description/summary
+        if not is_relevant(temp_desc):
+             # print(f"Skipping unrelated (Title & Desc mismatch): {title}")
+             return None
+
+    # Parse date to ensure it's today's news
+    pub_date_str = entry.published
+    is_today = False
+    try:
+        # RSS dates are RFC 822, which the email parser handles far faster than dateutil
         try:
+            dt = parsedate_to_datetime(pub_date_str)
+        except Exception:
             dt = dateutil.parser.parse(pub_date_str)
-            
-            # Convert to local system time if it has timezone info
-            if dt.tzinfo:
-                dt = dt.astimezone() # Convert to local system time
-                
-            # Global filter: News from Last 24 Hours
-            # This ensures morning visitors see news from last night
-            if (datetime.now().astimezone() - dt).total_seconds() <= 24 * 3600:
-                 is_today = True
-        except Exception as e:
-            # print(f"Date parsing error: {e}")
-            pass
         
-        if not is_today:
-             continue
+        # Convert to local system time if it has timezone info
+        if dt.tzinfo:
+            dt = dt.astimezone() # Convert to local system time
+            
+        # Global filter: News from Last 24 Hours
+        # This ensures morning visitors see news from last night
+        if (now - dt).total_seconds() <= 24 * 3600:
+             is_today = True
+    except Exception as e:
+        # print(f"Date parsing error: {e}")
+        pass
+    
+    if not is_today:
+         return None
 
-        # Extract Image (Thumbnail)
-        image_url = ""
-        is_logo = False
+    # Extract Image (Thumbnail)
+    image_url = ""
+    is_logo = False
+    
+    try:
+       # Check if description has an image
+        soup_desc = BeautifulSoup(summary_html, HTML_PARSER)
+        img_tag = soup_desc.find('img')
+        if img_tag and 'src' in img_tag.attrs:
+            image_url = img_tag['src']
+    except Exception as e:
+        # print(f"Image extraction error: {e}")
+        pass
         
-        try:
-           # Check if description has an image
-            soup_desc = BeautifulSoup(entry.summary, "html.parser")
-            img_tag = soup_desc.find('img')
-            if img_tag and 'src' in img_tag.attrs:
-                image_url = img_tag['src']
-        except Exception as e:
-            # print(f"Image extraction error: {e}")
-            pass
-            
-        # If no image found or it's a known pixel tracker (often 1x1), try source logo
-        if not image_url or "tracker" in image_url or "pixel" in image_url:
-            source_name = entry.source.title if 'source' in entry else ""
-            # Try exact match or partial match
-            domain = SOURCE_DOMAINS.get(source_name)
-            if not domain:
-                # Try to find a partial match manually
-                for name, dom in SOURCE_DOMAINS.items():
-                    if name.lower() in source_name.lower():
-                        domain = dom
-                        break
-            
-            if domain:
-                image_url = f"https://logo.clearbit.com/{domain}"
-                is_logo = True
-            else:
-                image_url = "https://via.placeholder.com/300x200?text=Latur+News"
-                is_logo = False
+    # If no image found or it's a known pixel tracker (often 1x1), try source logo
+    if not image_url or "tracker" in image_url or "pixel" in image_url:
+        # Try exact match or partial match
+        domain = find_source_domain(source_title)
 
-        # Description cleanup
-        description = BeautifulSoup(entry.summary, "html.parser").get_text()
+        if domain:
+            image_url = f"https://logo.clearbit.com/{domain}"
+            is_logo = True
+        else:
+            image_url = "https://via.placeholder.com/300x200?text=Latur+News"
+            is_logo = False
 
-        # Translation Logic
-        try:
-            # Detect language. If not Marathi, translate.
-            # We concat title and description for better detection context
-            full_text = f"{title} {description}"
-            detected = TRANSLATOR.detect(full_text)
-            
-            if detected.lang != 'mr':
-                # Translate Title
-                title = TRANSLATOR.translate(title, dest='mr').text
-                # Translate Description (truncate if too long to save API/time)
-                description = TRANSLATOR.translate(description[:500], dest='mr').text
-        except Exception as e:
-            # Fallback: keep original text if translation fails
-            # print(f"Translation warning for '{title[:20]}...': {e}")
-            pass
+    # Description cleanup
+    description = temp_desc
+
+    # Translation happens in one batch after filtering.
+    # Strict filtering already done on title.
+
+    return {
+        "title": title,
+        "link": link,
+        "date": pub_date_str, # Keep original string for display
+        "image": image_url,
+        "is_logo": is_logo,
+        "source": source_title or "News Portal",
+        "description": description
+    }
+
+def fetch_and_process_news():
+    print(f"[{datetime.now()}] Checking for news from multiple sources...")
 
-        # Strict filtering already done on title.
+    # Fetch from all queries concurrently
+    all_entries = get_event_loop().run_until_complete(fetch_all())
 
+    # Identical entries (same story, source and summary from overlapping queries)
+    # always get the same result, so only the first is processed
+    unique_entries = []
+    seen_entries = set()
+    for entry in all_entries:
+        if entry in seen_entries:
+            continue
+        seen_entries.add(entry)
+        unique_entries.append((entry, entry.title.lower()))
+
+    # Reference time for the 24-hour filter, computed once per run
+    now = datetime.now().astimezone()
+
+    # Sort entries by published date (newest first)
+    # Default sorting might be mixed, so let's try to sort if parsed_published exists
+    # If not, we rely on feed order (usually relevant)
+
+    # Filter and build items across a thread pool; map() keeps the input order
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(lambda pair: process_entry(pair[0], pair[1], now), unique_entries))
 
+    # A story only claims its title key once a copy of it passes the filters,
+    # so a rejected copy from one publisher cannot hide a kept copy from another
+    news_items = []
+    seen_titles = set()
+    for (entry, title_l), item in zip(unique_entries, results):
+        if item is None:
+            continue
+        key = title_key(title_l)
+        if key in seen_titles:
+            continue
+        seen_titles.add(key)
+        news_items.append(item)
 
-        news_items.append({
-            "title": title,
-            "link": link,
-            "date": pub_date_str, # Keep original string for display
-            "image": image_url,
-            "is_logo": is_logo,
-            "source": entry.source.title if 'source' in entry else "News Portal",
-            "description": description
-        })
+    translate_items(news_items)
 
     # Save to JSON
-    with open(JSON_FILE, "w", encoding="utf-8") as f:
-        json.dump(news_items, f, ensure_ascii=False, indent=4)
+    # Write to a temp file and swap it in, so readers never see a missing or partial file.
+    # orjson writes UTF-8 directly and never escapes non-ASCII, so Marathi stays readable
+    tmp_file = JSON_FILE + ".tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(b"[\n")
+        for i, item in enumerate(news_items):
+            if i:
+                f.write(b",\n")
+            f.write(orjson.dumps(item, option=orjson.OPT_INDENT_2))
+        f.write(b"\n]\n")
+    os.replace(tmp_file, JSON_FILE)
     
     print(f"[{datetime.now()}] Successfully updated {len(news_items)} news items.")
 